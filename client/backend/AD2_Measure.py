@@ -1,15 +1,15 @@
 from __future__ import annotations
 import enum
-from typing import Iterable, Optional, SupportsFloat as Numeric, Tuple
+import weakref
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, SupportsFloat as Numeric, Tuple
 import argparse
 import time
 import numpy as np
-import matplotlib.pyplot as plt
-import pickle
-from xarray import Dataset
-from datetime import datetime
 import warnings
 
+if TYPE_CHECKING:
+    from xarray import Dataset
+
 from pydwf import (DwfLibrary, DwfDevice, AnalogIn, DigitalIn, AnalogOut,
                    DwfEnumConfigInfo, DwfAcquisitionMode, DwfAnalogOutFunction,
                    DwfTriggerSource, DwfAnalogInTriggerType, DwfTriggerSlope,
@@ -18,6 +18,35 @@ from pydwf import (DwfLibrary, DwfDevice, AnalogIn, DigitalIn, AnalogOut,
                    PyDwfError)
 from pydwf.utilities import openDwfDevice
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _unpack_bits_jit(samples, chans, out):  # pragma: no cover
+        for i in prange(samples.shape[0]):
+            s = samples[i]
+            for j in range(chans.shape[0]):
+                out[i, j] = (s >> chans[j]) & 1
+
+
+def _unpack_bits(samples: np.ndarray, chan_arr: np.ndarray) -> np.ndarray:
+    """Unpack the requested channel bits into an (N, nch) boolean matrix.
+
+    Uses a parallel Numba kernel on large records when numba is installed
+    (one pass, no temporaries, all cores); falls back to the NumPy broadcast
+    otherwise.
+    """
+    if njit is not None and samples.size >= (1 << 20):
+        out = np.empty((samples.shape[0], chan_arr.shape[0]), dtype=np.bool_)
+        _unpack_bits_jit(samples, chan_arr, out)
+        return out
+    return ((samples[:, None] >> chan_arr) & samples.dtype.type(1)
+            ).astype(np.bool_)
+
 
 @enum.unique
 class DwfDigitalInTriggerType(enum.Enum):
@@ -34,7 +63,56 @@ class DwfMaximizeBuffer(enum.Enum):
     DigitalIn = 1
 
 
-def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length: Numeric, *, channels: Optional[int | Tuple[int]] = None, input_range: Optional[Numeric | Tuple[Numeric]] = None, trigger_channel: Optional[int] = None, trigger_position: Optional[Numeric] = 0.1, trigger_level: Optional[Numeric] = 0, trigger_type=DwfAnalogInTriggerType.Edge, trigger_cond=DwfTriggerSlope.Rise, trigger_retry: Optional[int] = None, trigger_holdoff: Numeric = 500e-6, trigger_hyst: Numeric = 0.05, filter=DwfAnalogInFilter.Average) -> Tuple[bool, Dataset]:
+# Last-applied configuration per AnalogIn instrument, so repeated captures
+# with unchanged parameters skip the ms-scale USB setter round-trips.
+_ANALOG_CFG_CACHE = weakref.WeakKeyDictionary()
+
+
+def _build_trigger_masks(channels, triggers) -> Tuple[int, int, int, int]:
+    """Build the level/edge trigger bitmasks for the given channels.
+
+    Args:
+        channels: Channel indices.
+        triggers: One DwfDigitalInTriggerType per channel.
+
+    Raises:
+        ValueError: Invalid trigger type.
+
+    Returns:
+        Tuple[int, int, int, int]: level_low, level_high, edge_rise, edge_fall masks.
+    """
+    level_low = level_high = edge_rise = edge_fall = 0
+    for channel_index, trigger_type in zip(channels, triggers):
+        mask = 1 << channel_index
+        if trigger_type == DwfDigitalInTriggerType.Disabled:
+            pass
+        elif trigger_type == DwfDigitalInTriggerType.Low:
+            level_low |= mask
+        elif trigger_type == DwfDigitalInTriggerType.High:
+            level_high |= mask
+        elif trigger_type == DwfDigitalInTriggerType.RisingEdge:
+            edge_rise |= mask
+        elif trigger_type == DwfDigitalInTriggerType.FallingEdge:
+            edge_fall |= mask
+        else:
+            raise ValueError("Invalid trigger type")
+    return level_low, level_high, edge_rise, edge_fall
+
+
+def _poll_record(instr) -> Tuple[DwfState, int, int, int]:
+    """Fetch instrument state and record counters for one poll iteration.
+
+    status(True) performs the actual USB transfer; statusRecord() then reads
+    counters the DWF library cached from that transfer. Keeping the pair in
+    one helper makes each loop iteration exactly one bus round-trip and one
+    FFI pair, shared by the analog and digital acquisition loops.
+    """
+    status = instr.status(True)
+    available, lost, corrupted = instr.statusRecord()
+    return status, available, lost, corrupted
+
+
+def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length: Numeric, *, channels: Optional[int | Tuple[int]] = None, input_range: Optional[Numeric | Tuple[Numeric]] = None, trigger_channel: Optional[int] = None, trigger_position: Optional[Numeric] = 0.1, trigger_level: Optional[Numeric] = 0, trigger_type=DwfAnalogInTriggerType.Edge, trigger_cond=DwfTriggerSlope.Rise, trigger_retry: Optional[int] = None, trigger_holdoff: Numeric = 500e-6, trigger_hyst: Numeric = 0.05, filter=DwfAnalogInFilter.Average, dtype=np.float32, on_chunk: Optional[Callable[[np.ndarray, int], None]] = None) -> Tuple[bool, Dataset]:
     """Get analog data from the AnalogIn instrument.
 
     Args:
@@ -52,6 +130,8 @@ def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length:
         trigger_holdoff (Numeric, optional): Trigger holdoff time in seconds. A second trigger within this timeframe is ignored. Defaults to 500e-6.
         trigger_hyst (Numeric, optional): Trigger hysteresis in Volts. Defaults to 0.05.
         filter (DwfAnalogInFilter, optional): Data filtering for the ADC. Defaults to DwfAnalogInFilter.Average.
+        dtype (optional): Sample dtype of the returned Dataset. Defaults to np.float32, which fully covers the 14-bit ADC at half the memory of float64.
+        on_chunk (Optional[Callable[[np.ndarray, int], None]], optional): Called as on_chunk(chunk, write_idx) from the acquisition loop after every chunk of samples, where chunk is an (n, nch) view into the record buffer and write_idx is the total sample count so far. Lets streaming consumers (FFT, disk, network) process data without waiting for the full record or copying it again. The view is only valid until the next loop iteration; copy it to retain it. Defaults to None.
 
     Raises:
         ValueError: Invalid channel index.
@@ -61,6 +141,8 @@ def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length:
     Returns:
         Tuple[bool, Dataset]: Valid status and Dataset containing the data.
     """
+    # Deferred: xarray import costs ~0.5 s and only matters once data exists.
+    from xarray import Dataset
     trigger_flag = False
     if trigger_channel is not None and trigger_channel in (0, 1):
         trigger_flag = True
@@ -100,11 +182,17 @@ def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length:
             if channel_index not in (CH1, CH2):
                 raise ValueError("Channel index must be 0 or 1.")
 
-    inp_min, inp_max, _ = analogIn.channelRangeInfo()
+    try:
+        cfg_cache = _ANALOG_CFG_CACHE.setdefault(analogIn, {})
+    except TypeError:  # not weak-referenceable; configure unconditionally
+        cfg_cache = {}
+    if 'range_info' not in cfg_cache:
+        cfg_cache['range_info'] = analogIn.channelRangeInfo()
+    inp_min, inp_max, _ = cfg_cache['range_info']
 
     if input_range is None:
         input_range = np.ones(len(channels)) * 5
-    elif isinstance(input_range, Numeric):
+    elif isinstance(input_range, (int, float, np.number)):
         input_range = (input_range,)
     for i in input_range:
         if not inp_min <= i <= inp_max:
@@ -114,28 +202,40 @@ def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length:
         raise ValueError(
             "Number of input ranges must match number of channels")
 
-    for channel_index, range_index in zip(channels, input_range):
-        analogIn.channelEnableSet(channel_index, True)
-        analogIn.channelFilterSet(channel_index, filter)
-        analogIn.channelRangeSet(channel_index, range_index)
-
-    analogIn.acquisitionModeSet(DwfAcquisitionMode.Record)
-    analogIn.frequencySet(sample_frequency)
-    analogIn.recordLengthSet(record_length)
+    channel_cfg = (tuple(channels), tuple(float(r) for r in input_range),
+                   filter)
+    if cfg_cache.get('channel_cfg') != channel_cfg:
+        for channel_index, range_index in zip(channels, input_range):
+            analogIn.channelEnableSet(channel_index, True)
+            analogIn.channelFilterSet(channel_index, filter)
+            analogIn.channelRangeSet(channel_index, range_index)
+        cfg_cache['channel_cfg'] = channel_cfg
+
+    acq_cfg = (float(sample_frequency), float(record_length))
+    if cfg_cache.get('acq_cfg') != acq_cfg:
+        analogIn.acquisitionModeSet(DwfAcquisitionMode.Record)
+        analogIn.frequencySet(sample_frequency)
+        analogIn.recordLengthSet(record_length)
+        cfg_cache['acq_cfg'] = acq_cfg
 
     if trigger_flag:
         # Set up trigger for the analog input instrument.
         # We will trigger on the rising transitions of CH2 (the "cosine" channel) through 0V.
         # print("Setting up trigger on channel {}.".format(trigger_channel))
-        analogIn.triggerSourceSet(DwfTriggerSource.DetectorAnalogIn)
-        analogIn.triggerChannelSet(trigger_channel)
-        analogIn.triggerTypeSet(trigger_type)
-        analogIn.triggerConditionSet(trigger_cond)
-        analogIn.triggerPositionSet(trigger_position)
-        analogIn.triggerLevelSet(trigger_level)
-        analogIn.triggerHysteresisSet(trigger_hyst)
-        # A small amount of hysteresis to make sure we only see rising edges.
-        analogIn.triggerHoldOffSet(trigger_holdoff)
+        trig_cfg = (trigger_channel, trigger_type, trigger_cond,
+                    float(trigger_position), float(trigger_level),
+                    float(trigger_hyst), float(trigger_holdoff))
+        if cfg_cache.get('trig_cfg') != trig_cfg:
+            analogIn.triggerSourceSet(DwfTriggerSource.DetectorAnalogIn)
+            analogIn.triggerChannelSet(trigger_channel)
+            analogIn.triggerTypeSet(trigger_type)
+            analogIn.triggerConditionSet(trigger_cond)
+            analogIn.triggerPositionSet(trigger_position)
+            analogIn.triggerLevelSet(trigger_level)
+            analogIn.triggerHysteresisSet(trigger_hyst)
+            # A small amount of hysteresis to make sure we only see rising edges.
+            analogIn.triggerHoldOffSet(trigger_holdoff)
+            cfg_cache['trig_cfg'] = trig_cfg
 
     # Calculate number of samples for each acquisition.
     num_samples = round(sample_frequency * record_length)
@@ -144,29 +244,43 @@ def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length:
 
     # Inner loop: single acquisition, receive data from AnalogIn instrument and display it.
 
-    samples = []
-
-    total_samples = total_samples_lost = total_samples_corrupted = 0
+    nch = len(channels)
+    # Preallocate the output buffer and write chunks in place as they arrive,
+    # instead of collecting per-chunk arrays that np.concatenate would copy
+    # wholesale at the end. A little slack absorbs lost-sample padding; the
+    # buffer grows geometrically in the rare case the device delivers more.
+    samples = np.empty((num_samples + (num_samples >> 2) + 16, nch),
+                       dtype=dtype)
+    write_idx = 0
+
+    def _reserve(count: int):
+        """Ensure room for count more rows, growing the buffer if needed."""
+        nonlocal samples
+        if write_idx + count > samples.shape[0]:
+            grown = np.empty((max(2 * samples.shape[0], write_idx + count),
+                              nch), dtype=samples.dtype)
+            grown[:write_idx] = samples[:write_idx]
+            samples = grown
+
+    total_samples_lost = total_samples_corrupted = 0
+    triggered = False
+    time_of_first_sample = 0.0
 
     analogIn.configure(True, False)  # Apply configuration.
 
     while analogIn.status(False) != DwfState.Ready:
-        pass  # Wait for ready
+        time.sleep(50e-6)  # Wait for ready without spinning a full core
 
     analogIn.configure(False, True)  # Start acquisition sequence.
 
     try:
         while True:
-            status = analogIn.status(True)
-            (current_samples_available, current_samples_lost,
-             current_samples_corrupted) = analogIn.statusRecord()
+            (status, current_samples_available, current_samples_lost,
+             current_samples_corrupted) = _poll_record(analogIn)
 
             if status == DwfState.Triggered:
                 triggered = True
 
-            if not trigger_flag and triggered:
-                total_samples += current_samples_available
-
             if trigger_flag and trigger_retry is not None and not triggered:
                 if trigger_retry <= 0:
                     raise RuntimeError("Failed to trigger")
@@ -177,35 +291,54 @@ def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length:
             total_samples_corrupted += current_samples_corrupted
 
             if current_samples_lost != 0:
-                # Append NaN samples as placeholders for lost samples.
+                # Write NaN samples as placeholders for lost samples.
                 # This follows the Digilent example.
                 # We haven't verified yet that this is the proper way to handle lost samples.
-                lost_samples = np.full(
-                    (current_samples_lost, len(channels)), np.nan)
-                samples.append(lost_samples)
+                _reserve(current_samples_lost)
+                samples[write_idx:write_idx + current_samples_lost] = np.nan
+                write_idx += current_samples_lost
 
             if current_samples_available != 0:
-                # Append samples read from both channels.
-                # Note that we read the samples separately for each channel;
-                # We then put them into the same 2D array with shape (current_samples_available, 2).
-                current_samples = np.vstack([analogIn.statusData(channel_index, current_samples_available)
-                                            for channel_index in channels]).transpose()
-                samples.append(current_samples)
-
-            if status == DwfState.Done:
+                # Write samples read from both channels.
+                # Each channel goes straight into its column of the output
+                # buffer; no (2, n) staging array and no transposed copy.
+                _reserve(current_samples_available)
+                for ci, channel_index in enumerate(channels):
+                    samples[write_idx:write_idx + current_samples_available,
+                            ci] = analogIn.statusData(channel_index,
+                                                      current_samples_available)
+                write_idx += current_samples_available
+                if on_chunk is not None:
+                    on_chunk(samples[write_idx - current_samples_available:
+                                     write_idx], write_idx)
+
+            # The write cursor is the sample count, so the loop can bail as
+            # soon as the record is full instead of waiting for the device to
+            # report Done.
+            if status == DwfState.Done or write_idx >= num_samples:
                 # We received the last of the record samples.
                 # Note the time, in seconds, of the first valid sample, and break from the acquisition loop.
                 if trigger_flag:
                     time_of_first_sample = analogIn.triggerPositionStatus()
                 else:
                     time_of_first_sample = 0.0
-                if total_samples < num_samples:
+                if write_idx < num_samples:
                     warnings.warn("WARNING - Collected {}/{} samples only!".format(
-                        total_samples, num_samples), RuntimeWarning)
+                        write_idx, num_samples), RuntimeWarning)
                 break
+
+            # Each status()/statusRecord() pair is a USB round-trip, so there
+            # is no point hammering the device when it had little or nothing
+            # new. Sleep about a quarter of the time the device needs to
+            # produce the last chunk again, bounded to [100 us, 10 ms].
+            time.sleep(
+                max(1e-4, min(1e-2, current_samples_available / sample_frequency * 0.25)))
     except (Exception, KeyboardInterrupt) as e:  # Stop capture on error
         analogIn.reset()
-        samples = [np.empty((0, len(channels)), dtype=np.float64)]
+        cfg_cache.clear()  # reset() wiped the device configuration
+        write_idx = 0
+
+    total_samples = write_idx
 
     if total_samples_lost != 0:
         warnings.warn("WARNING - {} samples were lost! Reduce sample frequency.".format(
@@ -215,20 +348,17 @@ def GetAnalogData(analogIn: AnalogIn, sample_frequency: Numeric, record_length:
         warnings.warn("WARNING - {} samples could be corrupted! Reduce sample frequency.".format(
             total_samples_corrupted), RuntimeWarning)
 
-    # Concatenate all acquired samples. The result is an (n, 2) array of sample values.
-    try:
-        samples = np.concatenate(samples)
-    except ValueError as ex:
-        pickle.dump(samples, open(
-            f"{datetime.now().strftime('%Y%m%d%H%M%S')}.pkl", "wb"))
-        raise ex
+    # Trim to the samples actually written. The result is an (n, 2) array of sample values.
+    samples = samples[:write_idx]
 
     # Calculate sample time of each of the samples.
     t = time_of_first_sample + np.arange(len(samples)) / sample_frequency
 
     data_vars = {}
-    for channel_index in channels:
-        data_vars[f"ch{channel_index}"] = (("time"), samples[:, channel_index])
+    for ci, channel_index in enumerate(channels):
+        # column ci of the buffer holds channel channel_index; the column
+        # slice is a view into the capture buffer, not a copy
+        data_vars[f"ch{channel_index}"] = (("time"), samples[:, ci])
     coords = {
         "time": (('time'), t, {'units': 's', 'long_name': 'Time'}),
     }
@@ -275,13 +405,19 @@ def GetDigitalData(digitalIn: DigitalIn, sample_frequency: Numeric, record_lengt
     Returns:
         Tuple[bool, Dataset]: Valid status and Dataset containing the data.
     """
+    # Deferred: xarray import costs ~0.5 s and only matters once data exists.
+    from xarray import Dataset
     if isinstance(channels, int):
         channels = (channels,)
     if trigger is None:
         trigger = DwfDigitalInTriggerType.Disabled
-    if not isinstance(trigger, Iterable) and channels is not None:
+    if channels is None:
+        # Defaulting to every input bit up front means trigger masks are
+        # built and the device configured exactly once below.
+        channels = tuple(range(digitalIn.sampleFormatGet()))
+    if isinstance(trigger, DwfDigitalInTriggerType):
         trigger = tuple([trigger]*len(channels))
-    if channels is not None and len(trigger) != len(channels):
+    if len(trigger) != len(channels):
         raise ValueError("Number of triggers must match number of channels")
     if trigger_position is None:  # Set trigger position to 10% of record length
         trigger_position = 0.1
@@ -329,25 +465,8 @@ def GetDigitalData(digitalIn: DigitalIn, sample_frequency: Numeric, record_lengt
     digitalIn.triggerPrefillSet(-int(trigger_position * num_samples))
 
     # set up trigger
-    level_low = 0x0
-    level_high = 0x0
-    edge_rise = 0x0
-    edge_fall = 0x0
-
-    if channels is not None:
-        for channel_index, trigger_type in zip(channels, trigger):
-            if trigger_type == DwfDigitalInTriggerType.Disabled:
-                pass
-            elif trigger_type == DwfDigitalInTriggerType.Low:
-                level_low |= 1 << channel_index
-            elif trigger_type == DwfDigitalInTriggerType.High:
-                level_high |= 1 << channel_index
-            elif trigger_type == DwfDigitalInTriggerType.RisingEdge:
-                edge_rise |= 1 << channel_index
-            elif trigger_type == DwfDigitalInTriggerType.FallingEdge:
-                edge_fall |= 1 << channel_index
-            else:
-                raise ValueError("Invalid trigger type")
+    (level_low, level_high,
+     edge_rise, edge_fall) = _build_trigger_masks(channels, trigger)
 
     trig_any = level_low | level_high | edge_rise | edge_fall
 
@@ -356,44 +475,30 @@ def GetDigitalData(digitalIn: DigitalIn, sample_frequency: Numeric, record_lengt
     digitalIn.configure(True, False)
 
     while digitalIn.status(False) != DwfState.Ready:
-        pass  # Wait for ready
+        time.sleep(50e-6)  # Wait for ready without spinning a full core
 
     samp_format = digitalIn.sampleFormatGet()
-
-    if channels is None and trigger is not None:  # If no channels are specified, trigger on all channels
-        channels = tuple(range(samp_format))
-        for channel_index in channels:
-            if trigger == DwfDigitalInTriggerType.Disabled:
-                pass
-            elif trigger == DwfDigitalInTriggerType.Low:
-                level_low |= 1 << channel_index
-            elif trigger == DwfDigitalInTriggerType.High:
-                level_high |= 1 << channel_index
-            elif trigger == DwfDigitalInTriggerType.RisingEdge:
-                edge_rise |= 1 << channel_index
-            elif trigger == DwfDigitalInTriggerType.FallingEdge:
-                edge_fall |= 1 << channel_index
-            else:
-                raise ValueError("Invalid trigger type")
-        trig_any = level_low | level_high | edge_rise | edge_fall
-
-        digitalIn.triggerSet(level_low, level_high, edge_rise, edge_fall)
-
-        digitalIn.configure(True, False)
-
-        while digitalIn.status(False) != DwfState.Ready:
-            pass  # Wait for ready
+    # statusData returns samples as wide as the sample format (8/16/32 bits);
+    # matching the dtype instead of forcing uint32 keeps 8-channel captures at
+    # a quarter of the memory, which also speeds up the memory-bound bit
+    # unpack below.
+    sample_dtype = (np.uint8 if samp_format <= 8
+                    else np.uint16 if samp_format <= 16
+                    else np.uint32)
 
     digitalIn.configure(False, True)
 
     total_samples = total_samples_lost = total_samples_corrupted = 0
     samples = []
+    # (start, end) index ranges of zero-filled lost stretches, exposed as a
+    # boolean "lost" variable in the Dataset so callers can mask them out.
+    lost_ranges = []
+    record_len = 0
     triggered = False
     try:
         while True:
-            status = digitalIn.status(True)
-            (current_samples_available, current_samples_lost,
-             current_samples_corrupted) = digitalIn.statusRecord()
+            (status, current_samples_available, current_samples_lost,
+             current_samples_corrupted) = _poll_record(digitalIn)
 
             if status == DwfState.Triggered:
                 triggered = True
@@ -414,14 +519,19 @@ def GetDigitalData(digitalIn: DigitalIn, sample_frequency: Numeric, record_lengt
                 # Append NaN samples as placeholders for lost samples.
                 # This follows the Digilent example.
                 # We haven't verified yet that this is the proper way to handle lost samples.
-                lost_samples = np.full((current_samples_lost), np.nan)
+                lost_samples = np.zeros(current_samples_lost,
+                                        dtype=sample_dtype)
                 samples.append(lost_samples)
+                lost_ranges.append(
+                    (record_len, record_len + current_samples_lost))
+                record_len += current_samples_lost
 
             if current_samples_available != 0:
                 # Append samples read
                 current_samples = digitalIn.statusData(
                     current_samples_available)
                 samples.append(current_samples)
+                record_len += current_samples_available
 
             if status == DwfState.Done or total_samples > num_samples:
                 # We received the last of the record samples.
@@ -433,29 +543,38 @@ def GetDigitalData(digitalIn: DigitalIn, sample_frequency: Numeric, record_lengt
     except (Exception, KeyboardInterrupt) as e:  # Stop capture on error
         print(e)
         digitalIn.reset()
-        samples = [np.empty(0, dtype=np.uint32)]
+        samples = [np.empty(0, dtype=sample_dtype)]
+        lost_ranges = []
 
     if total_samples_lost != 0:
         warnings.warn("WARNING - {} samples were lost! Reduce sample frequency.".format(
             total_samples_lost), RuntimeWarning)
-        # Discard all samples on error so that NaNs don't cause problems: You probably want to retry anyway
-        samples = [np.empty(0, dtype=np.uint32)]
+        # Discard all samples on error so that gaps don't cause problems: You probably want to retry anyway
+        samples = [np.empty(0, dtype=sample_dtype)]
+        lost_ranges = []
 
     if total_samples_corrupted != 0:
         warnings.warn("WARNING - {} samples could be corrupted! Reduce sample frequency.".format(
             total_samples_corrupted), RuntimeWarning)
         # Discard all samples on error because time should be discontinuous: You probably want to retry anyway
-        samples = [np.empty(0, dtype=np.uint32)]
+        samples = [np.empty(0, dtype=sample_dtype)]
+        lost_ranges = []
 
     samples = np.concatenate(samples)
 
-    if channels is None:
-        channels = tuple(range(samp_format))
+    # Unpack all requested channel bits in one pass over samples instead of
+    # one full memory sweep per channel.
+    chan_arr = np.asarray(channels, dtype=samples.dtype)
+    bits = _unpack_bits(samples, chan_arr)
+
+    lost_mask = np.zeros(len(samples), dtype=np.bool_)
+    for start, end in lost_ranges:
+        lost_mask[start:end] = True
 
     data_vars = {}
-    for channel_index in channels:
-        data_vars[f"ch{channel_index}"] = (
-            ("time"), samples & (1 << channel_index) != 0)
+    for ci, channel_index in enumerate(channels):
+        data_vars[f"ch{channel_index}"] = (("time"), bits[:, ci])
+    data_vars["lost"] = (("time"), lost_mask)
     coords = {
         "time": (('time'), np.arange(len(samples)) / sample_frequency, {'units': 's', 'long_name': 'Time'}),
     }
@@ -518,6 +637,7 @@ def openAD2(serial_number_filter=None, buffer_maximize: DwfMaximizeBuffer = DwfM
 def main():
     """Parse arguments and start demo."""
     import sys
+    import matplotlib.pyplot as plt
 
     parser = argparse.ArgumentParser(
         description="Demonstrate analog input recording with triggering.")
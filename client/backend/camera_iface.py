@@ -1,14 +1,28 @@
 # %% Imports
 from __future__ import annotations
 import json
+import math
 import sys
+import time
 from typing import Any, List, Optional
 import warnings
+import msgpack
 import zmq
 import zmq.utils.monitor as zmonitor
 from datetime import timedelta
 import enum
 from result import Result, Ok, Err
+try:
+    import orjson
+    _json_dumps = orjson.dumps  # C implementation, returns bytes directly
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_loads(buf):
+        # stdlib json cannot take a memoryview
+        return json.loads(bytes(buf) if isinstance(buf, memoryview) else buf)
 # %% Commands
 
 
@@ -117,6 +131,16 @@ class ReturnCodes(enum.IntEnum):
     VmbErrorRetriesExceeded = -40,
     VmbErrorInsufficientBufferCount = -41,  # The operation requires more buffers
     VmbErrorCustom = 1,  # The minimum error code to use for user defined error codes to avoid conflict with existing error codes
+
+
+# Reverse maps so the reply path skips the enum __call__ machinery; unknown
+# values map to the catch-all members instead of raising.
+_RETCODE_MAP = ReturnCodes._value2member_map_
+_CMD_MAP = Commands._value2member_map_
+
+# Ok(None) is immutable, so every successful set can share one instance
+# instead of allocating a fresh Result per call.
+_OK_NONE: Result[None, ReturnCodes] = Ok(None)
 # %% Connection
 
 
@@ -124,28 +148,162 @@ class Camera:
     pass
 
 
+_POOL: dict = {}  # (host, port) -> opened CameraConnection
+
+# Cache lifetimes (seconds) for Camera property reads. Commands not listed
+# are never cached; the entries here are fixed for a given camera, so reading
+# them repeatedly in a loop should not cost a round-trip each time.
+_CACHE_TTL = {
+    Commands.SensorSize: math.inf,
+    Commands.TrigLines: math.inf,
+    Commands.ImageFormats: math.inf,
+    Commands.SensorBitDepths: math.inf,
+}
+
+# How long the value echoed back by a set reply stays valid for reads. Long
+# enough to cover a read-after-write, short enough that drifting values
+# (framerate under auto mode) are re-read almost immediately.
+_SET_ECHO_TTL = 1e-3
+
+
 class CameraConnection:
     """Establish connection to a camera server. Allows for camera enumeration, and property setting/getting.
     """
 
-    def __init__(self, ctx: Optional[zmq.Context] = None, cam_id: Optional[str] = None, host: str = 'localhost', port: int = 5555, quit_on_close: bool = False):
+    @classmethod
+    def acquire(cls, host: str = 'localhost', port: int = 5555, **kwargs) -> CameraConnection:
+        """Get a shared, already-open connection to a camera server.
+
+        open() pays socket setup plus one round-trip per camera for the ADIO
+        bit assignment; callers that talk to the same server repeatedly can
+        amortize that cost by sharing one pooled connection per (host, port).
+        The pooled connection stays open until close() is called on it.
+
+        Args:
+            host (str, optional): Server hostname. Defaults to 'localhost'.
+            port (int, optional): Server port. Defaults to 5555.
+
+        Returns:
+            CameraConnection: Open connection, shared across callers.
+        """
+        key = (host, port)
+        conn = _POOL.get(key)
+        if conn is None or not conn._opened:
+            conn = cls(host=host, port=port, **kwargs)
+            conn.open()
+            _POOL[key] = conn
+        return conn
+
+    def __init__(self, ctx: Optional[zmq.Context] = None, cam_id: Optional[str] = None, host: str = 'localhost', port: int = 5555, quit_on_close: bool = False, use_msgpack: bool = True):
         self._ctx = ctx
         self._cam_id = '' if cam_id is None else cam_id
         self._host = host
         self._port = port
         self._qoc = quit_on_close
+        self._use_msgpack = use_msgpack
+        # requests carry only the fields the server reads; retcode/retargs
+        # exist on replies only
         self._packet = {
             'cmd_type': 'list',
             'cam_id': '',
             'command': -1,
             'arguments': [],
-            'retcode': 0,
-            'retargs': [],
         }
         self._opened = False
+        self._status_cache = {}  # cam_id -> packed status request bytes
+        # One Packer per connection: packb creates a fresh Packer (and its
+        # internal buffer) on every call, which is measurable on the per-call
+        # request path.
+        self._packer = msgpack.Packer(use_bin_type=True)
+
+    def _pack(self, packet: dict) -> bytes:
+        """Serialize a packet for the wire.
+
+        MessagePack is the default; the server tells the formats apart by the
+        first byte of the message (a msgpack map never starts with '{') and
+        replies in kind, so JSON remains available as a fallback.
+        """
+        if self._use_msgpack:
+            return self._packer.pack(packet)
+        return _json_dumps(packet)
+
+    def _unpack(self, reply: bytes) -> dict:
+        """Deserialize a reply from the wire."""
+        if self._use_msgpack:
+            return msgpack.unpackb(reply, raw=False)
+        return _json_loads(reply)
+
+    def _transact(self, cmd_type: str, cam_id: str, command: int = -1, arguments: Optional[List[Any]] = None) -> dict:
+        """Run one request/reply round-trip.
+
+        The request packet is reused across calls: only the four fields that
+        actually vary are written, the constant retcode/retargs fields are
+        encoded as-is.
+        """
+        packet = self._packet
+        packet['cmd_type'] = cmd_type
+        packet['cam_id'] = cam_id
+        packet['command'] = command
+        packet['arguments'] = [] if arguments is None else arguments
+        self._send(self._pack(packet))
+        return self._unpack(self._recv())
+
+    def _send(self, data: bytes):
+        """Send a request, raising TimeoutError if the server is unreachable.
+
+        With IMMEDIATE set the socket refuses to queue toward a peer that is
+        not connected, so a downed server surfaces here as zmq.Again once the
+        send deadline expires instead of blocking forever.
+        """
+        try:
+            self._sock.send(data)
+        except zmq.Again:
+            raise TimeoutError(
+                f'Could not send to tcp://{self._host}:{self._port}; server unreachable') from None
+
+    def _recv(self, timeout: float = 1.0) -> bytes:
+        """Receive a reply, raising TimeoutError after an explicit deadline.
+
+        A poll with a deadline replaces the socket-wide RCVTIMEO: the timeout
+        is deterministic per request and a dead server surfaces as an
+        exception instead of a silent REQ-state mangle.
+        """
+        if self._poller.poll(int(timeout * 1e3)):
+            # hand the zmq frame buffer straight to the decoder, skipping the
+            # bytes copy; msgpack and orjson both accept memoryviews
+            return self._sock.recv(copy=False).buffer
+        raise TimeoutError(
+            f'No reply from tcp://{self._host}:{self._port} within {timeout} s')
+
+    def _status(self, cam_id: str) -> dict:
+        """Status poll with the encoded request cached per camera.
+
+        Status requests are byte-identical from poll to poll, so the packed
+        message is built once per cam_id and replayed on every poll.
+        """
+        cached = self._status_cache.get(cam_id)
+        if cached is None:
+            packet = dict(self._packet)
+            packet['cmd_type'] = 'status'
+            packet['cam_id'] = cam_id
+            packet['command'] = -1
+            packet['arguments'] = []
+            cached = self._pack(packet)
+            self._status_cache[cam_id] = cached
+        self._send(cached)
+        return self._unpack(self._recv())
 
     def __del__(self):
-        self.close()
+        # No graceful quit handshake here: during interpreter shutdown module
+        # globals may already be gone, and a REQ/REP round-trip with a reply
+        # timeout has no place in GC. The handshake still runs through
+        # __exit__ / an explicit close().
+        try:
+            if self._opened:
+                self._sock.close(linger=0)
+                self._opened = False
+        except Exception:
+            pass
 
     def __enter__(self):
         self.open()
@@ -157,41 +315,65 @@ class CameraConnection:
     def close(self):
         if self._opened:
             if self._qoc:
-                self._packet['cmd_type'] = 'quit'
-                self._sock.send(json.dumps(self._packet).encode('utf-8'))
-                _ = self._sock.recv()
+                _ = self._transact('quit', '')
             self._sock.close()
             self._opened = False
+            if _POOL.get((self._host, self._port)) is self:
+                del _POOL[(self._host, self._port)]
 
     def open(self):
+        if self._opened:
+            return
         if self._ctx is None:
-            self._ctx = zmq.Context()
+            # The process-wide shared context: multiple connections then share
+            # one set of zmq I/O threads instead of spawning one per instance.
+            self._ctx = zmq.Context.instance()
         self._sock: zmq.Socket = self._ctx.socket(zmq.REQ)
-        self._sock.setsockopt(zmq.RCVTIMEO, 1000)
         self._sock.setsockopt(zmq.REQ_CORRELATE, 1)
         self._sock.setsockopt(zmq.REQ_RELAXED, 1)
         self._sock.setsockopt(zmq.LINGER, 0)
+        # TCP tuning: keepalive detects dead servers behind quiet links, and
+        # explicit HWM/buffer sizes keep bursts of small commands (e.g. the
+        # pipelined ADIO setup or multiget batches) from stalling on defaults.
+        # libzmq already disables Nagle on TCP, so no TCP_NODELAY needed.
+        self._sock.setsockopt(zmq.TCP_KEEPALIVE, 1)
+        self._sock.setsockopt(zmq.TCP_KEEPALIVE_IDLE, 30)
+        # never queue to a peer that is not connected; fail fast instead.
+        # IMMEDIATE makes send() itself block while the server is down, so it
+        # needs a send deadline to match the poll deadline on the recv side.
+        self._sock.setsockopt(zmq.IMMEDIATE, 1)
+        self._sock.setsockopt(zmq.SNDTIMEO, 1000)
+        self._sock.setsockopt(zmq.SNDHWM, 1000)
+        self._sock.setsockopt(zmq.RCVHWM, 1000)
+        self._sock.setsockopt(zmq.SNDBUF, 1 << 20)
+        self._sock.setsockopt(zmq.RCVBUF, 1 << 20)
         self._sock.connect(f"tcp://{self._host}:{self._port}")
-        self._sock.send(json.dumps(self._packet).encode('utf-8'))
-        reply = self._sock.recv()
-        packet = json.loads(reply)
+        self._poller = zmq.Poller()
+        self._poller.register(self._sock, zmq.POLLIN)
+        packet = self._transact('list', '')
         if packet['retcode'] != ReturnCodes.VmbErrorSuccess:
             raise Exception(
                 f'Command {packet["cmd_type"]}: Error: {packet["retcode"]}')
         self._cameras = packet['retargs']
-        for idx, camera in enumerate(self._cameras):
-            packet['cam_id'] = camera
-            packet['cmd_type'] = 'set'
-            packet['command'] = Commands.ADIOBit
-            packet['arguments'] = [str(idx)]
-            self._sock.send(json.dumps(packet).encode('utf-8'))
-            reply = self._sock.recv()
-            packet = json.loads(reply)
-            if packet['retcode'] != ReturnCodes.VmbErrorSuccess:
-                retcode = ReturnCodes(packet['retcode'])
-                command = Commands(packet['command'])
-                warnings.warn(
-                    f'Command {packet["cmd_type"]} ({command.name}): Error: {retcode.name}')
+        self._cameras_set = frozenset(self._cameras)  # O(1) membership checks
+        if len(self._cameras) > 0:
+            # One adio_assign request hands every camera its ADIO bit (bit
+            # index = position in the camera list), so the whole setup costs a
+            # single round-trip regardless of how many cameras are attached.
+            packet = self._transact('adio_assign', '',
+                                    arguments=list(self._cameras))
+            rc = packet['retcode']
+            if rc != ReturnCodes.VmbErrorSuccess:
+                retcode = _RETCODE_MAP.get(rc, ReturnCodes.VmbErrorUnknown)
+                warnings.warn(f'Command adio_assign: Error: {retcode.name}')
+            else:
+                for camera, crc in zip(self._cameras, packet['retargs']):
+                    crc = int(crc)
+                    if crc != 0:
+                        retcode = _RETCODE_MAP.get(
+                            crc, ReturnCodes.VmbErrorUnknown)
+                        warnings.warn(
+                            f'Command adio_assign ({camera}): Error: {retcode.name}')
         self._opened = True
 
     @property
@@ -204,57 +386,109 @@ class CameraConnection:
 
     @property
     def status(self) -> Result[List[str], ReturnCodes]:
-        self._packet['cmd_type'] = 'status'
-        self._packet['cam_id'] = ''  # for all
-        self._sock.send(json.dumps(self._packet).encode('utf-8'))
-        reply = self._sock.recv()
-        packet = json.loads(reply)
-        if packet['retcode'] != ReturnCodes.VmbErrorSuccess:
-            return Err(ReturnCodes(packet['retcode']))
+        packet = self._status('')  # empty cam_id: all cameras
+        rc = packet['retcode']
+        if rc != 0:  # VmbErrorSuccess
+            return Err(_RETCODE_MAP.get(rc, ReturnCodes.VmbErrorUnknown))
         return Ok(packet['retargs'])
 
     def set_nocheck(self, camera_id: str, command: Commands, arguments: List[Any]) -> Result[None, ReturnCodes]:
-        self._packet['cmd_type'] = 'set'
-        self._packet['cam_id'] = camera_id
-        self._packet['command'] = command.value
-        self._packet['arguments'] = [str(arg) for arg in arguments]
-        self._sock.send(json.dumps(self._packet).encode('utf-8'))
-        reply = self._sock.recv()
-        packet = json.loads(reply)
-        retcode = ReturnCodes(packet['retcode'])
-        if retcode != ReturnCodes.VmbErrorSuccess:
-            return Err(retcode)
-        return Ok(None)
+        if len(arguments) == 1 and isinstance(arguments[0], str):
+            args = arguments  # common case: a single, already-string argument
+        else:
+            # ints and floats travel natively; the server stringifies them on
+            # ingest, so the decimal formatting cost moves off this hot path.
+            args = [arg if isinstance(arg, (str, int, float)) else str(arg)
+                    for arg in arguments]
+        packet = self._transact('set', camera_id, command.value, args)
+        rc = packet['retcode']
+        if rc != 0:  # VmbErrorSuccess; enum members built on errors only
+            return Err(_RETCODE_MAP.get(rc, ReturnCodes.VmbErrorUnknown))
+        return _OK_NONE
 
     def set(self, camera_id: str, command: Commands, arguments: List[Any]) -> Result[None, ReturnCodes]:
-        if camera_id not in self._cameras:
-            return None
+        if camera_id not in self._cameras_set:
+            return Err(ReturnCodes.VmbErrorNotFound)
         return self.set_nocheck(camera_id, command, arguments)
 
+    def set_echo(self, camera_id: str, command: Commands, arguments: List[Any]) -> Result[List[str], ReturnCodes]:
+        """Set a camera property, returning the value the device settled on.
+
+        The set reply already carries the device-side readback in retargs
+        (e.g. the clamped exposure), so surfacing it spares callers the
+        separate get round-trip after a write.
+
+        Args:
+            camera_id (str): Camera ID.
+            command (Commands): Property command.
+            arguments (List[Any]): List of arguments.
+
+        Returns:
+            Result[List[str], ReturnCodes]: Echoed values or error code.
+        """
+        if camera_id not in self._cameras_set:
+            return Err(ReturnCodes.VmbErrorNotFound)
+        if len(arguments) == 1 and isinstance(arguments[0], str):
+            args = arguments
+        else:
+            args = [arg if isinstance(arg, (str, int, float)) else str(arg)
+                    for arg in arguments]
+        packet = self._transact('set', camera_id, command.value, args)
+        rc = packet['retcode']
+        if rc != 0:  # VmbErrorSuccess
+            return Err(_RETCODE_MAP.get(rc, ReturnCodes.VmbErrorUnknown))
+        return Ok(packet['retargs'])
+
     def get_nocheck(self, camera_id: str, command: Commands) -> Result[List[str], ReturnCodes]:
-        self._packet['cmd_type'] = 'get'
-        self._packet['cam_id'] = camera_id
-        self._packet['command'] = command.value
-        self._packet['arguments'] = []
-        self._sock.send(json.dumps(self._packet).encode('utf-8'))
-        reply = self._sock.recv()
-        packet = json.loads(reply)
-        if packet['retcode'] != ReturnCodes.VmbErrorSuccess:
-            return Err(ReturnCodes(packet['retcode']))
+        packet = self._transact('get', camera_id, command.value)
+        rc = packet['retcode']
+        if rc != 0:  # VmbErrorSuccess
+            return Err(_RETCODE_MAP.get(rc, ReturnCodes.VmbErrorUnknown))
         return Ok(packet['retargs'])
 
     def get(self, camera_id: str, command: Commands) -> Result[List[str], ReturnCodes]:
-        if camera_id not in self._cameras:
-            return None
+        if camera_id not in self._cameras_set:
+            return Err(ReturnCodes.VmbErrorNotFound)
         return self.get_nocheck(camera_id, command)
 
+    def get_many(self, camera_id: str, commands: List[Commands]) -> Result[dict, ReturnCodes]:
+        """Get several camera properties in a single round-trip.
+
+        Args:
+            camera_id (str): Camera ID.
+            commands (List[Commands]): Property commands to read.
+
+        Returns:
+            Result[dict, ReturnCodes]: Per-command Results keyed by command, or an error code if the batch itself failed.
+        """
+        packet = self._transact('multiget', camera_id,
+                                arguments=[str(cmd.value) for cmd in commands])
+        rc = packet['retcode']
+        if rc != 0:  # VmbErrorSuccess
+            return Err(_RETCODE_MAP.get(rc, ReturnCodes.VmbErrorUnknown))
+        # reply is a flattened [command, retcode, count, args...] per command
+        retargs = packet['retargs']
+        out = {}
+        idx = 0
+        while idx + 3 <= len(retargs):
+            command = _CMD_MAP.get(int(retargs[idx]), Commands.InvalidCommand)
+            retcode = int(retargs[idx + 1])
+            count = int(retargs[idx + 2])
+            args = retargs[idx + 3:idx + 3 + count]
+            idx += 3 + count
+            if retcode != 0:  # VmbErrorSuccess
+                out[command] = Err(_RETCODE_MAP.get(
+                    retcode, ReturnCodes.VmbErrorUnknown))
+            else:
+                out[command] = Ok(args)
+        return Ok(out)
+
     def get_camera(self, camera_id: str) -> Camera:
         return Camera(self, camera_id)
 
     @property
     def capture_maxlen(self) -> timedelta:
         res = self.get_nocheck(self._cameras[0], Commands.CaptureMaxLen)
-        print(res)
         if res.is_err():
             return timedelta(0)
         return timedelta(milliseconds=float(res.unwrap()[0]))
@@ -272,6 +506,7 @@ class Camera:
     def __init__(self, parent: CameraConnection, cam_id: str):
         self._parent = parent
         self._cam_id = cam_id
+        self._cache = {}  # command -> (expiry, Result)
 
     @property
     def status(self) -> Result[List[str], ReturnCodes]:
@@ -280,14 +515,10 @@ class Camera:
         Returns:
             Result[List[str], ReturnCodes]: Status list or error code.
         """
-        self._parent._packet['cmd_type'] = 'status'
-        self._parent._packet['cam_id'] = self._cam_id  # for all
-        self._parent._sock.send(json.dumps(
-            self._parent._packet).encode('utf-8'))
-        reply = self._parent._sock.recv()
-        packet = json.loads(reply)
-        if packet['retcode'] != ReturnCodes.VmbErrorSuccess:
-            return Err(ReturnCodes(packet['retcode']))
+        packet = self._parent._status(self._cam_id)
+        rc = packet['retcode']
+        if rc != 0:  # VmbErrorSuccess
+            return Err(_RETCODE_MAP.get(rc, ReturnCodes.VmbErrorUnknown))
         return Ok(packet['retargs'])
 
     def set(self, command: Commands, arguments: List[Any]) -> Result[None, ReturnCodes]:
@@ -300,10 +531,102 @@ class Camera:
         Returns:
             Result[None, ReturnCodes]: Ok on success, Err on failure.
         """
-        return self._parent.set(self._cam_id, command, arguments)
+        res = self._parent.set_echo(self._cam_id, command, arguments)
+        if res.is_err():
+            self._cache.pop(command, None)  # unknown state, drop cached read
+            return res
+        echoed = res.unwrap()
+        if echoed:
+            # the reply carries the device-clamped value; a read-after-write
+            # within the echo window is served from it without a round-trip
+            self._cache[command] = (time.monotonic() + _SET_ECHO_TTL,
+                                    Ok(echoed))
+        else:
+            self._cache.pop(command, None)
+        return _OK_NONE
 
     def get(self, command: Commands) -> Result[List[str], ReturnCodes]:
-        return self._parent.get(self._cam_id, command)
+        # entries carry their own expiry, whether seeded by a TTL read or by
+        # a set-reply echo
+        hit = self._cache.get(command)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+        ttl = _CACHE_TTL.get(command)
+        res = self._parent.get(self._cam_id, command)
+        if ttl is not None and res is not None and res.is_ok():
+            self._cache[command] = (time.monotonic() + ttl, res)
+        return res
+
+    def get_many(self, commands: List[Commands]) -> Result[dict, ReturnCodes]:
+        """Get several camera properties in a single round-trip.
+
+        Args:
+            commands (List[Commands]): Property commands to read.
+
+        Returns:
+            Result[dict, ReturnCodes]: Per-command Results keyed by command.
+        """
+        return self._parent.get_many(self._cam_id, commands)
+
+    def describe(self) -> dict:
+        """Read the full camera state in a single round-trip.
+
+        All read-only properties travel in one multiget request instead of a
+        round-trip per property, which is what the property accessors cost.
+
+        Returns:
+            dict: Property values keyed by property name; properties that failed to read are omitted.
+        """
+        spec = (
+            ('sensor_size', Commands.SensorSize,
+             lambda a: [int(x) for x in a]),
+            ('image_size', Commands.ImageSize,
+             lambda a: [int(x) for x in a]),
+            ('image_ofst', Commands.ImageOfst,
+             lambda a: [int(x) for x in a]),
+            ('trigger_line', Commands.TrigLine, lambda a: a[0]),
+            ('trigger_lines', Commands.TrigLines, list),
+            ('trigger_mode', Commands.TrigLineMode, lambda a: a[0]),
+            ('trigger_src', Commands.TrigLineSrc, lambda a: a[0]),
+            ('trigger_srcs', Commands.TrigLineSrcs, list),
+            ('exposure', Commands.ExposureUs,
+             lambda a: timedelta(microseconds=float(a[0]))),
+            ('framerate', Commands.AcqFramerate, lambda a: float(a[0])),
+            ('framerate_auto', Commands.AcqFrameRateAuto,
+             lambda a: a[0] == 'True'),
+            ('image_format', Commands.ImageFormat, lambda a: a[0]),
+            ('image_formats', Commands.ImageFormats, list),
+            ('sensor_bit_depth', Commands.SensorBitDepth, lambda a: a[0]),
+            ('sensor_bit_depths', Commands.SensorBitDepths, list),
+            ('througput_limit', Commands.ThroughputLimit,
+             lambda a: int(a[0])),
+            ('througput_limit_range', Commands.ThroughputLimitRange,
+             lambda a: [int(x) for x in a]),
+        )
+        res = self.get_many([cmd for _, cmd, _ in spec])
+        if res.is_err():
+            return {}
+        vals = res.unwrap()
+        out = {}
+        for name, cmd, conv in spec:
+            sub = vals.get(cmd)
+            if sub is not None and sub.is_ok():
+                try:
+                    out[name] = conv(sub.unwrap())
+                except (IndexError, ValueError):
+                    pass
+        return out
+
+    def _get1(self, command: Commands, default):
+        """Read a single-valued property, returning default on error.
+
+        Skips the intermediate list handling for the scalar property getters.
+        """
+        res = self.get(command)
+        if res is None or res.is_err():
+            return default
+        args = res.unwrap()
+        return args[0] if args else default
 
     @property
     def sensor_size(self) -> List[int]:
@@ -315,7 +638,8 @@ class Camera:
         res = self.get(Commands.SensorSize)
         if res.is_err():
             return []
-        return list(map(int, res.unwrap()))
+        w, h = res.unwrap()
+        return [int(w), int(h)]
 
     @property
     def image_size(self) -> List[int]:
@@ -327,7 +651,8 @@ class Camera:
         res = self.get(Commands.ImageSize)
         if res.is_err():
             return []
-        return list(map(int, res.unwrap()))
+        w, h = res.unwrap()
+        return [int(w), int(h)]
 
     @image_size.setter
     def image_size(self, value: List[int]):
@@ -343,7 +668,8 @@ class Camera:
         res = self.get(Commands.ImageOfst)
         if res.is_err():
             return []
-        return list(map(int, res.unwrap()))
+        w, h = res.unwrap()
+        return [int(w), int(h)]
 
     @image_ofst.setter
     def image_ofst(self, value: List[int]):
@@ -361,10 +687,7 @@ class Camera:
         Returns:
             str: trigger line name
         """
-        res = self.get(Commands.TrigLine)
-        if res.is_err():
-            return ''
-        return res.unwrap()[0]
+        return self._get1(Commands.TrigLine, '')
 
     @trigger_line.setter
     def trigger_line(self, value: str):
@@ -394,10 +717,7 @@ class Camera:
         Returns:
             str: Input/Output
         """
-        res = self.get(Commands.TrigLineMode)
-        if res.is_err():
-            return ''
-        return res.unwrap()[0]
+        return self._get1(Commands.TrigLineMode, '')
 
     @trigger_mode.setter
     def trigger_mode(self, mode: str):
@@ -424,10 +744,7 @@ class Camera:
         Returns:
             str: trigger source name.
         """
-        res = self.get(Commands.TrigLineSrc)
-        if res.is_err():
-            return ''
-        return res.unwrap()[0]
+        return self._get1(Commands.TrigLineSrc, '')
 
     @trigger_src.setter
     def trigger_src(self, value: str):
@@ -440,10 +757,10 @@ class Camera:
         Returns:
             Timedelta: exposure time
         """
-        res = self.get(Commands.ExposureUs)
-        if res.is_err():
+        val = self._get1(Commands.ExposureUs, None)
+        if val is None:
             return timedelta(0)
-        return timedelta(microseconds=float(res.unwrap()[0]))
+        return timedelta(microseconds=float(val))
 
     @exposure.setter
     def exposure(self, value: timedelta):
@@ -456,14 +773,15 @@ class Camera:
         Returns:
             bool: True if auto framerate is enabled
         """
-        res = self.get(Commands.AcqFrameRateAuto)
-        if res.is_err():
+        val = self._get1(Commands.AcqFrameRateAuto, None)
+        if val is None:
             return None
-        return res.unwrap()[0] == 'True'
+        return val == 'True'
 
     @framerate_auto.setter
     def framerate_auto(self, value: bool):
-        self.set(Commands.AcqFrameRateAuto, [str(value)])
+        # bools travel natively; the server stringifies them on ingest
+        self.set(Commands.AcqFrameRateAuto, [value])
 
     @property
     def framerate(self) -> float:
@@ -472,10 +790,10 @@ class Camera:
         Returns:
             float: framerate
         """
-        res = self.get(Commands.AcqFramerate)
-        if res.is_err():
+        val = self._get1(Commands.AcqFramerate, None)
+        if val is None:
             return 0
-        return float(res.unwrap()[0])
+        return float(val)
 
     @framerate.setter
     def framerate(self, value: float):
@@ -488,10 +806,7 @@ class Camera:
         Returns:
             str: image format
         """
-        res = self.get(Commands.ImageFormat)
-        if res.is_err():
-            return ''
-        return res.unwrap()[0]
+        return self._get1(Commands.ImageFormat, '')
 
     @image_format.setter
     def image_format(self, value: str):
@@ -516,10 +831,7 @@ class Camera:
         Returns:
             str: sensor bit depth
         """
-        res = self.get(Commands.SensorBitDepth)
-        if res.is_err():
-            return ''
-        return res.unwrap()[0]
+        return self._get1(Commands.SensorBitDepth, '')
 
     @sensor_bit_depth.setter
     def sensor_bit_depth(self, value: str):
@@ -544,10 +856,10 @@ class Camera:
         Returns:
             int: throughput limit
         """
-        res = self.get(Commands.ThroughputLimit)
-        if res.is_err():
+        val = self._get1(Commands.ThroughputLimit, None)
+        if val is None:
             return 0
-        return int(res.unwrap()[0])
+        return int(val)
 
     @througput_limit.setter
     def througput_limit(self, value: int):
@@ -576,33 +888,46 @@ class Camera:
         """
         auto = self.framerate_auto
 
-        fps_target = fps = self.framerate
-        exposure_max = timedelta(microseconds=50)
-        increment = timedelta(seconds=1/fps) * 0.25
-        self.exposure = exposure_max
-        exposure_prev = timedelta(seconds=1/fps)
-        while abs((exposure_prev - exposure_max).total_seconds()) > 50e-6 and retry > 0 and increment.total_seconds() > 10e-6:
-            exposure_prev = exposure_max
-            while self.framerate >= fps_target:
-                exposure_max += increment
-                self.exposure = exposure_max
-                exposure_max = self.exposure
-                if not auto:
-                    self.framerate = fps_target
-                retry -= 1
-            # flip!
-            increment /= 2
-            while self.framerate < fps_target:
-                exposure_max -= increment
-                self.exposure = exposure_max
-                exposure_max = self.exposure
-                if not auto:
-                    self.framerate = fps_target
-                retry -= 1
-            # flip!
-            increment /= 2
-
-        return exposure_max
+        def read_fps_exposure():
+            # One multiget round-trip replaces the separate framerate and
+            # exposure readbacks that dominate each search iteration.
+            res = self.get_many([Commands.AcqFramerate, Commands.ExposureUs])
+            if res.is_err():
+                return self.framerate, self.exposure
+            vals = res.unwrap()
+            fps_res = vals.get(Commands.AcqFramerate)
+            exp_res = vals.get(Commands.ExposureUs)
+            fps_val = (float(fps_res.unwrap()[0])
+                       if fps_res is not None and fps_res.is_ok() else 0.0)
+            exp_val = (timedelta(microseconds=float(exp_res.unwrap()[0]))
+                       if exp_res is not None and exp_res.is_ok()
+                       else timedelta(0))
+            return fps_val, exp_val
+
+        fps_target = self.framerate
+        # The achievable framerate is monotone non-increasing in exposure, so
+        # bisect on [minimum exposure, frame period]: each probe sets the
+        # midpoint and checks whether the target framerate still holds. That
+        # converges in ~log2(range / 10 us) probes where the old linear step
+        # search could burn the full retry budget.
+        lo = timedelta(microseconds=50)
+        hi = timedelta(seconds=1 / fps_target)
+        best = lo
+        while (hi - lo).total_seconds() > 10e-6 and retry > 0:
+            mid = lo + (hi - lo) / 2
+            self.exposure = mid
+            if not auto:
+                self.framerate = fps_target
+            fps, actual = read_fps_exposure()
+            if fps >= fps_target:
+                best = actual  # what the device actually accepted
+                lo = mid
+            else:
+                hi = mid
+            retry -= 1
+
+        self.exposure = best
+        return best
 # %% Test
 
 
@@ -615,14 +940,9 @@ def main():
         print(cam_man.capture_maxlen)
         cam = cam_man.get_camera(cam_man.cameras[0])
         print(cam.status)
-        print(cam.sensor_size)
-        print(cam.image_size)
-        print(cam.image_ofst)
-        print(cam.trigger_line)
-        print(cam.trigger_lines)
-        print(cam.trigger_mode)
-        print(cam.trigger_src)
-        print(cam.trigger_srcs)
+        # the full read-only state dump costs one round-trip
+        for name, value in cam.describe().items():
+            print(f'{name}: {value}')
         cam.trigger_mode = 'Output'
         cam.trigger_src = 'ExposureActive'
         print(cam.trigger_src)
@@ -633,12 +953,6 @@ def main():
         cam.framerate_auto = True
         print(cam.framerate_auto)
         print(cam.framerate)
-        print(cam.image_format)
-        print(cam.image_formats)
-        print(cam.sensor_bit_depth)
-        print(cam.sensor_bit_depths)
-        print(cam.througput_limit)
-        print(cam.througput_limit_range)
         cam.image_size = [256, 256]
         print(cam.image_size)
         print(cam.framerate)
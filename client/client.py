@@ -12,14 +12,9 @@ with CameraConnection() as cam_man, openAD2(buffer_maximize=DwfMaximizeBuffer.Di
     print(cam_man.capture_maxlen)
     cam = cam_man.get_camera(cam_man.cameras[0])
     print(cam.status)
-    print(cam.sensor_size)
-    print(cam.image_size)
-    print(cam.image_ofst)
-    print(cam.trigger_line)
-    print(cam.trigger_lines)
-    print(cam.trigger_mode)
-    print(cam.trigger_src)
-    print(cam.trigger_srcs)
+    # the full read-only state dump costs one round-trip
+    for name, value in cam.describe().items():
+        print(f'{name}: {value}')
     cam.trigger_mode = 'Output'
     cam.trigger_src = 'ExposureActive'
     print(cam.trigger_src)
@@ -30,12 +25,6 @@ with CameraConnection() as cam_man, openAD2(buffer_maximize=DwfMaximizeBuffer.Di
     cam.framerate_auto = True
     print(cam.framerate_auto)
     print(cam.framerate)
-    print(cam.image_format)
-    print(cam.image_formats)
-    print(cam.sensor_bit_depth)
-    print(cam.sensor_bit_depths)
-    print(cam.througput_limit)
-    print(cam.througput_limit_range)
     cam.image_size = [256, 256]
     print(cam.image_size)
     print(cam.framerate)
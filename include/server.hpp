@@ -55,7 +55,48 @@ public:
     int retcode = VmbErrorSuccess;
     std::vector<std::string> retargs;
 
-    NLOHMANN_DEFINE_TYPE_INTRUSIVE(NetPacket, cmd_type, cam_id, command, arguments, retcode, retargs)
+    friend void to_json(json &j, const NetPacket &p)
+    {
+        j = json{{"cmd_type", p.cmd_type},
+                 {"cam_id", p.cam_id},
+                 {"command", p.command},
+                 {"arguments", p.arguments},
+                 {"retcode", p.retcode},
+                 {"retargs", p.retargs}};
+    }
+
+    friend void from_json(const json &j, NetPacket &p)
+    {
+        j.at("cmd_type").get_to(p.cmd_type);
+        j.at("cam_id").get_to(p.cam_id);
+        j.at("command").get_to(p.command);
+        // Arguments may arrive as native numbers/booleans instead of decimal
+        // strings; stringify them here so the command handlers keep their
+        // atoi/atof parsing unchanged.
+        p.arguments.clear();
+        for (const auto &arg : j.at("arguments"))
+        {
+            if (arg.is_string())
+            {
+                p.arguments.push_back(arg.get<std::string>());
+            }
+            else if (arg.is_boolean())
+            {
+                p.arguments.push_back(arg.get<bool>() ? "True" : "False");
+            }
+            else
+            {
+                p.arguments.push_back(arg.dump()); // numbers keep their decimal form
+            }
+        }
+        // Reply-only fields: requests omit them to save bytes.
+        p.retcode = j.value("retcode", (int)VmbErrorSuccess);
+        p.retargs.clear();
+        if (j.contains("retargs"))
+        {
+            j.at("retargs").get_to(p.retargs);
+        }
+    }
 };
 
 namespace std
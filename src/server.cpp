@@ -26,6 +26,95 @@
 #include "stringhasher.hpp"
 #include "string_format.hpp"
 
+// Run a single "get" command for a camera, appending the results to reply.
+// Shared by the "get" and "multiget" request paths.
+static VmbError_t handle_get(ImageCam *image_cam, int command, int64_t &capture_timelim, std::vector<std::string> &reply)
+{
+    VmbError_t err = VmbErrorSuccess;
+    switch (command)
+    {
+        GET_CASE_STR(image_format)
+        GET_CASE_STR(sensor_bit_depth)
+        GET_CASE_STR(trigline)
+        GET_CASE_STR(trigline_mode)
+        GET_CASE_STR(trigline_src)
+        GET_CASE_DBL(exposure_us)
+        GET_CASE_DBL(acq_framerate)
+        GET_CASE_BOOL(acq_framerate_auto)
+        GET_CASE_INT(throughput_limit)
+        GET_CASE_LIST(trigline_src_list)
+        GET_CASE_LIST(triglines_list)
+        GET_CASE_LIST(image_format_list)
+        GET_CASE_LIST(sensor_bit_depth_list)
+    case CommandNames::frame_size:
+    {
+        uint32_t fsize = allied_get_frame_size(image_cam->handle);
+        ZSYS_INFO("get (%s): frame_size -> %d", image_cam->get_info().idstr.c_str(), fsize);
+        reply.push_back(std::to_string(fsize));
+        break;
+    }
+    case CommandNames::sensor_size:
+    {
+        VmbInt64_t width = 0, height = 0;
+        err = allied_get_sensor_size(image_cam->handle, &width, &height);
+        ZSYS_INFO("get (%s): sensor_size -> %ld x %ld", image_cam->get_info().idstr.c_str(), width, height);
+        reply.push_back(std::to_string(width));
+        reply.push_back(std::to_string(height));
+        break;
+    }
+    case CommandNames::image_size:
+    {
+        VmbInt64_t width = 0, height = 0;
+        err = allied_get_image_size(image_cam->handle, &width, &height);
+        ZSYS_INFO("get (%s): image_size -> %ld x %ld", image_cam->get_info().idstr.c_str(), width, height);
+        reply.push_back(std::to_string(width));
+        reply.push_back(std::to_string(height));
+        break;
+    }
+    case CommandNames::image_ofst:
+    {
+        VmbInt64_t width = 0, height = 0;
+        err = allied_get_image_ofst(image_cam->handle, &width, &height);
+        ZSYS_INFO("get (%s): image_ofst -> %ld x %ld", image_cam->get_info().idstr.c_str(), width, height);
+        reply.push_back(std::to_string(width));
+        reply.push_back(std::to_string(height));
+        break;
+    }
+    case CommandNames::adio_bit:
+    {
+        ZSYS_INFO("get (%s): adio_bit", image_cam->get_info().idstr.c_str());
+        reply.push_back(std::to_string(image_cam->adio_bit));
+        break;
+    }
+    case CommandNames::throughput_limit_range:
+    {
+        VmbInt64_t vmin = 0, vmax = 0;
+        err = allied_get_throughput_limit_range(image_cam->handle, &vmin, &vmax, NULL);
+        ZSYS_INFO("get (%s): throughput_limit_range -> %ld, %ld", image_cam->get_info().idstr.c_str(), vmin, vmax);
+        reply.push_back(std::to_string(vmin));
+        reply.push_back(std::to_string(vmax));
+        break;
+    }
+    case CommandNames::camera_info:
+    {
+        ZSYS_INFO("get (%s): camera_info", image_cam->get_info().idstr.c_str());
+        reply.push_back(std::to_string(image_cam->get_info()));
+    }
+    case CommandNames::capture_maxlen:
+    {
+        ZSYS_INFO("get: capture_maxlen: %ld", capture_timelim);
+        reply.push_back(std::to_string(capture_timelim));
+        break;
+    }
+    default:
+    {
+        err = VmbErrorWrongType; // wrong command
+        break;
+    }
+    }
+    return err;
+}
+
 int main(int argc, char *argv[])
 {
     // Initialize ZSYS
@@ -182,16 +271,28 @@ int main(int argc, char *argv[])
             }
             continue;
         }
-        char *message = zstr_recv(which);
-        if (message == NULL)
+        zframe_t *frame = zframe_recv(which);
+        if (frame == NULL)
         {
             char *ident = zsock_identity(which);
             ZSYS_INFO("Client disconnected: %s", ident);
             zstr_free(&ident);
             continue;
         }
-        NetPacket packet = json::parse(message);
-        zstr_free(&message);
+        const uint8_t *msgdata = zframe_data(frame);
+        size_t msgsize = zframe_size(frame);
+        // A JSON packet always starts with '{'; anything else is MessagePack.
+        bool use_msgpack = (msgsize > 0) && (msgdata[0] != '{');
+        NetPacket packet;
+        if (use_msgpack)
+        {
+            packet = json::from_msgpack(msgdata, msgdata + msgsize);
+        }
+        else
+        {
+            packet = json::parse(msgdata, msgdata + msgsize);
+        }
+        zframe_destroy(&frame);
 
         packet.retargs.clear();               // clear return arguments
         uint32_t chash = atol(packet.cam_id.c_str()); // get camera hash
@@ -311,86 +412,33 @@ int main(int argc, char *argv[])
             {
                 ImageCam *image_cam = imagecams.at(chash);
                 std::vector<std::string> reply;
-                switch (packet.command)
-                {
-                    GET_CASE_STR(image_format)
-                    GET_CASE_STR(sensor_bit_depth)
-                    GET_CASE_STR(trigline)
-                    GET_CASE_STR(trigline_mode)
-                    GET_CASE_STR(trigline_src)
-                    GET_CASE_DBL(exposure_us)
-                    GET_CASE_DBL(acq_framerate)
-                    GET_CASE_BOOL(acq_framerate_auto)
-                    GET_CASE_INT(throughput_limit)
-                    GET_CASE_LIST(trigline_src_list)
-                    GET_CASE_LIST(triglines_list)
-                    GET_CASE_LIST(image_format_list)
-                    GET_CASE_LIST(sensor_bit_depth_list)
-                case CommandNames::frame_size:
-                {
-                    uint32_t fsize = allied_get_frame_size(image_cam->handle);
-                    ZSYS_INFO("get (%s): frame_size -> %d", image_cam->get_info().idstr.c_str(), fsize);
-                    reply.push_back(std::to_string(fsize));
-                    break;
-                }
-                case CommandNames::sensor_size:
-                {
-                    VmbInt64_t width = 0, height = 0;
-                    err = allied_get_sensor_size(image_cam->handle, &width, &height);
-                    ZSYS_INFO("get (%s): sensor_size -> %ld x %ld", image_cam->get_info().idstr.c_str(), width, height);
-                    reply.push_back(std::to_string(width));
-                    reply.push_back(std::to_string(height));
-                    break;
-                }
-                case CommandNames::image_size:
-                {
-                    VmbInt64_t width = 0, height = 0;
-                    err = allied_get_image_size(image_cam->handle, &width, &height);
-                    ZSYS_INFO("get (%s): image_size -> %ld x %ld", image_cam->get_info().idstr.c_str(), width, height);
-                    reply.push_back(std::to_string(width));
-                    reply.push_back(std::to_string(height));
-                    break;
-                }
-                case CommandNames::image_ofst:
-                {
-                    VmbInt64_t width = 0, height = 0;
-                    err = allied_get_image_ofst(image_cam->handle, &width, &height);
-                    ZSYS_INFO("get (%s): image_ofst -> %ld x %ld", image_cam->get_info().idstr.c_str(), width, height);
-                    reply.push_back(std::to_string(width));
-                    reply.push_back(std::to_string(height));
-                    break;
-                }
-                case CommandNames::adio_bit:
-                {
-                    ZSYS_INFO("get (%s): adio_bit", image_cam->get_info().idstr.c_str());
-                    reply.push_back(std::to_string(image_cam->adio_bit));
-                    break;
-                }
-                case CommandNames::throughput_limit_range:
-                {
-                    VmbInt64_t vmin = 0, vmax = 0;
-                    err = allied_get_throughput_limit_range(image_cam->handle, &vmin, &vmax, NULL);
-                    ZSYS_INFO("get (%s): throughput_limit_range -> %ld, %ld", image_cam->get_info().idstr.c_str(), vmin, vmax);
-                    reply.push_back(std::to_string(vmin));
-                    reply.push_back(std::to_string(vmax));
-                    break;
-                }
-                case CommandNames::camera_info:
-                {
-                    ZSYS_INFO("get (%s): camera_info", image_cam->get_info().idstr.c_str());
-                    reply.push_back(std::to_string(image_cam->get_info()));
-                }
-                case CommandNames::capture_maxlen:
-                {
-                    ZSYS_INFO("get: capture_maxlen: %ld", capture_timelim);
-                    reply.push_back(std::to_string(capture_timelim));
-                    break;
-                }
-                default:
+                err = handle_get(image_cam, packet.command, capture_timelim, reply);
+                packet.retargs = reply;
+            }
+            catch (const std::out_of_range &oor)
+            {
+                err = VmbErrorNotFound;
+            }
+        }
+        else if (packet.cmd_type == "multiget")
+        {
+            // Run several "get" commands in one round-trip. Each entry of
+            // packet.arguments is a command id; the reply is a flattened list
+            // of [command, retcode, count, args...] per command so a failing
+            // command does not abort the rest of the batch.
+            try
+            {
+                ImageCam *image_cam = imagecams.at(chash);
+                std::vector<std::string> reply;
+                for (auto &arg : packet.arguments)
                 {
-                    err = VmbErrorWrongType; // wrong command
-                    break;
-                }
+                    int command = atoi(arg.c_str());
+                    std::vector<std::string> sub;
+                    VmbError_t cerr = handle_get(image_cam, command, capture_timelim, sub);
+                    reply.push_back(std::to_string(command));
+                    reply.push_back(std::to_string(cerr));
+                    reply.push_back(std::to_string(sub.size()));
+                    reply.insert(reply.end(), sub.begin(), sub.end());
                 }
                 packet.retargs = reply;
             }
@@ -399,6 +447,28 @@ int main(int argc, char *argv[])
                 err = VmbErrorNotFound;
             }
         }
+        else if (packet.cmd_type == "adio_assign")
+        {
+            // Assign ADIO bits to the listed cameras in order (bit index =
+            // position in the list), replacing one "set adio_bit" round-trip
+            // per camera with a single request. The reply carries one retcode
+            // per listed camera so a bad entry does not abort the rest.
+            for (size_t idx = 0; idx < packet.arguments.size(); idx++)
+            {
+                VmbError_t cerr = VmbErrorSuccess;
+                try
+                {
+                    ImageCam *image_cam = imagecams.at(atol(packet.arguments[idx].c_str()));
+                    image_cam->adio_bit = (int)idx;
+                    ZSYS_INFO("set (%s): adio_bit = %d", image_cam->get_info().idstr.c_str(), image_cam->adio_bit);
+                }
+                catch (const std::out_of_range &oor)
+                {
+                    cerr = VmbErrorNotFound;
+                }
+                packet.retargs.push_back(std::to_string(cerr));
+            }
+        }
         else if (packet.cmd_type == "set")
         {
             if (packet.arguments.size() < 1) // no data to set
@@ -506,9 +576,18 @@ int main(int argc, char *argv[])
             err = VmbErrorBadParameter; // wrong command
         }
         packet.retcode = err; // set return code
-        // send reply
+        // send reply in the same format the request arrived in
         json j = packet;
-        zstr_send(which, j.dump().c_str());
+        if (use_msgpack)
+        {
+            std::vector<uint8_t> buf = json::to_msgpack(j);
+            zframe_t *reply = zframe_new(buf.data(), buf.size());
+            zframe_send(&reply, which, 0);
+        }
+        else
+        {
+            zstr_send(which, j.dump().c_str());
+        }
     }
     // Cleanup
     zpoller_destroy(&poller);